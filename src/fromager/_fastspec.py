@@ -0,0 +1,83 @@
+"""Fast-path evaluation for simple version specifier sets.
+
+Constraint specifiers are overwhelmingly of the simple
+``>=X,<Y`` shape: comma-separated clauses using the six plain
+comparison operators on release-only versions. Evaluating those
+through :class:`packaging.specifiers.SpecifierSet` pays regex parsing
+per clause and tuple comparisons per check.
+
+:func:`parse_specset` scans such a specifier without regexes into
+``(operator code, packed version key)`` entries, using the packed-int
+representation from :mod:`fromager._fastversion`, so that
+:func:`contains` reduces to integer comparisons. Anything outside the
+simple shape -- wildcards, ``~=``, ``===``, pre/post/dev or local
+versions -- returns ``None`` and the caller keeps using
+``SpecifierSet``.
+"""
+
+from . import _fastversion
+
+# operator codes for parsed entries
+OP_EQ, OP_NE, OP_LE, OP_GE, OP_LT, OP_GT = range(6)
+
+_TWO_CHAR_OPS = {"==": OP_EQ, "!=": OP_NE, "<=": OP_LE, ">=": OP_GE}
+_ONE_CHAR_OPS = {"<": OP_LT, ">": OP_GT}
+
+type SpecEntries = tuple[tuple[int, int], ...]
+
+
+def parse_specset(spec: str) -> SpecEntries | None:
+    """Parse a simple specifier set into operator/key entries.
+
+    Returns ``None`` when any clause is outside the fast shape; the
+    caller must then fall back to ``SpecifierSet``. An empty specifier
+    parses to an empty tuple, which matches every version.
+    """
+    if not spec.strip():
+        return ()
+    entries: list[tuple[int, int]] = []
+    for clause in spec.split(","):
+        clause = clause.strip()
+        op = _TWO_CHAR_OPS.get(clause[:2])
+        if op is not None:
+            version = clause[2:]
+        else:
+            op = _ONE_CHAR_OPS.get(clause[:1])
+            if op is None:
+                return None
+            version = clause[1:]
+        key = _fastversion.parse_key(version.strip())
+        if key is None:
+            # includes '===' (leftover '=') and wildcards like '==1.0.*'
+            return None
+        entries.append((op, key))
+    return tuple(entries)
+
+
+def contains(entries: SpecEntries, key: int) -> bool:
+    """Check a packed version key against parsed specifier entries.
+
+    ``key`` must come from :func:`fromager._fastversion.parse_key`, so
+    both sides are release-only versions and PEP 440 pre/post-release
+    exclusion rules for ``<``/``>`` cannot apply.
+    """
+    for op, version_key in entries:
+        if op == OP_GE:
+            if key < version_key:
+                return False
+        elif op == OP_LT:
+            if key >= version_key:
+                return False
+        elif op == OP_LE:
+            if key > version_key:
+                return False
+        elif op == OP_GT:
+            if key <= version_key:
+                return False
+        elif op == OP_EQ:
+            if key != version_key:
+                return False
+        else:
+            if key == version_key:
+                return False
+    return True
@@ -0,0 +1,70 @@
+"""Fast-path parsing for release-only version strings.
+
+Most versions fromager encounters are plain release versions like
+``1.0.0`` -- no epoch, pre/post/dev markers, or local segments.
+:class:`packaging.version.Version` handles those through a large regex
+and compares them as tuples, which shows up in profiles when graphs
+with thousands of nodes are built or deserialized.
+
+This module provides a regex-free scanner for the release-only shape.
+Matching versions are packed into a single integer (16 bits per
+segment, up to 4 segments) so that equality and ordering reduce to
+plain integer comparisons. Anything that does not match the fast shape
+falls back to :class:`packaging.version.Version`.
+"""
+
+from packaging.version import Version
+
+# 16 bits per release segment, up to 4 segments packed into one int.
+SEGMENT_BITS = 16
+MAX_SEGMENTS = 4
+_MAX_SEGMENT_VALUE = (1 << SEGMENT_BITS) - 1
+
+
+def parse_key(version: str) -> int | None:
+    """Pack a release-only version string into a single integer.
+
+    Returns ``None`` if the string is not of the plain ``N(.N)*`` shape
+    with at most 4 segments of at most 16 bits each. Keys of versions
+    with fewer segments compare as if zero-padded, matching PEP 440
+    release ordering (``1.0`` == ``1.0.0``).
+    """
+    key = 0
+    segments = 0
+    value = 0
+    have_digit = False
+    for c in version:
+        if "0" <= c <= "9":
+            value = value * 10 + (ord(c) - 48)
+            if value > _MAX_SEGMENT_VALUE:
+                return None
+            have_digit = True
+        elif c == ".":
+            if not have_digit or segments >= MAX_SEGMENTS - 1:
+                return None
+            key = (key << SEGMENT_BITS) | value
+            segments += 1
+            value = 0
+            have_digit = False
+        else:
+            # epoch, pre/post/dev, local, wildcard, or whitespace
+            return None
+    if not have_digit:
+        return None
+    key = (key << SEGMENT_BITS) | value
+    segments += 1
+    # left-align so short versions compare as if zero-padded
+    return key << (SEGMENT_BITS * (MAX_SEGMENTS - segments))
+
+
+def parse(version: str) -> tuple[int, None] | tuple[None, Version]:
+    """Parse a version string, preferring the packed-int fastpath.
+
+    Returns ``(key, None)`` when the fastpath matches and
+    ``(None, Version(version))`` otherwise. Any exceptions from the
+    :class:`packaging.version.Version` fallback are propagated.
+    """
+    key = parse_key(version)
+    if key is not None:
+        return key, None
+    return None, Version(version)
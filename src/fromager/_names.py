@@ -0,0 +1,21 @@
+"""Interned cache for canonicalized package names.
+
+``packaging.utils.canonicalize_name`` lower-cases and regex-substitutes
+its input on every call, and the resulting names are used as dict keys
+all over fromager -- graph nodes, constraints, resolver identifiers.
+Caching the result and interning the returned string means repeated
+lookups hit CPython's pointer-equality fast path for unicode keys
+instead of comparing characters.
+"""
+
+import functools
+import sys
+import typing
+
+from packaging.utils import NormalizedName, canonicalize_name
+
+
+@functools.lru_cache(maxsize=8192)
+def canon(name: str) -> NormalizedName:
+    """Return the canonical form of a package name, interned and cached."""
+    return typing.cast(NormalizedName, sys.intern(canonicalize_name(name)))
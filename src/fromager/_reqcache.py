@@ -0,0 +1,15 @@
+"""Shared cache for parsed requirement strings.
+
+``packaging.requirements.Requirement`` runs a full PEP 508 parser on
+every construction. Resolve workflows parse the same requirement
+strings over and over -- constraint files, graph edges, and build
+requirements repeat heavily -- so route string parsing through a
+process-wide LRU cache. Callers must treat the returned ``Requirement``
+objects as immutable, since they are shared.
+"""
+
+import functools
+
+from packaging.requirements import Requirement
+
+parse_requirement = functools.lru_cache(maxsize=4096)(Requirement)
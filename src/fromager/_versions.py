@@ -0,0 +1,15 @@
+"""Shared cache for parsed version strings.
+
+``packaging.version.Version`` parses with a large regex. The same
+version strings recur constantly -- graph files repeat one string per
+edge and index pages list the same releases for every resolve -- so
+route string parsing through a process-wide LRU cache. The returned
+``Version`` objects are immutable and safe to share. Invalid versions
+still raise ``InvalidVersion``; failures are not cached.
+"""
+
+import functools
+
+from packaging.version import Version
+
+cached_version = functools.lru_cache(maxsize=4096)(Version)
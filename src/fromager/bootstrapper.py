@@ -15,7 +15,7 @@ import zipfile
 from urllib.parse import urlparse
 
 from packaging.requirements import Requirement
-from packaging.utils import NormalizedName, canonicalize_name
+from packaging.utils import NormalizedName
 from packaging.version import Version
 
 from . import (
@@ -30,6 +30,8 @@ from . import (
     sources,
     wheels,
 )
+from ._names import canon
+from ._reqcache import parse_requirement
 from .dependency_graph import DependencyGraph
 from .log import req_ctxvar_context
 from .requirements_file import RequirementType, SourceType
@@ -128,7 +130,7 @@ class Bootstrapper:
 
     def resolve_and_add_top_level(
         self,
-        req: Requirement,
+        req: Requirement | str,
     ) -> tuple[str, Version] | None:
         """Resolve a top-level requirement and add it to the dependency graph.
 
@@ -136,7 +138,8 @@ class Bootstrapper:
         In test mode, catches resolution errors and records them as failures.
 
         Args:
-            req: The top-level requirement to resolve.
+            req: The top-level requirement to resolve. Strings are parsed
+                through the shared requirement cache.
 
         Returns:
             Tuple of (source_url, version) if resolution succeeded, None if it
@@ -145,6 +148,8 @@ class Bootstrapper:
         Raises:
             Exception: In normal mode, re-raises any resolution error.
         """
+        if isinstance(req, str):
+            req = parse_requirement(req)
         try:
             pbi = self.ctx.package_build_info(req)
             source_url, version = self.resolve_version(
@@ -376,7 +381,7 @@ class Bootstrapper:
             hooks.run_post_bootstrap_hooks(
                 ctx=self.ctx,
                 req=req,
-                dist_name=canonicalize_name(req.name),
+                dist_name=canon(req.name),
                 dist_version=str(resolved_version),
                 sdist_filename=build_result.sdist_filename,
                 wheel_filename=build_result.wheel_filename,
@@ -1267,7 +1272,7 @@ class Bootstrapper:
         # useful but before we determine if it is redundant so that we capture all
         # edges to use for building a valid constraints file.
         self.ctx.dependency_graph.add_dependency(
-            parent_name=canonicalize_name(parent_req.name) if parent_req else None,
+            parent_name=canon(parent_req.name) if parent_req else None,
             parent_version=parent_version,
             req_type=req_type,
             req=req,
@@ -1288,7 +1293,7 @@ class Bootstrapper:
         self, req: Requirement, version: Version, typ: typing.Literal["sdist", "wheel"]
     ) -> SeenKey:
         return (
-            canonicalize_name(req.name),
+            canon(req.name),
             tuple(sorted(req.extras)),
             str(version),
             typ,
@@ -1336,7 +1341,7 @@ class Bootstrapper:
         # value, included in the _resolved_key() output, can confuse
         # that so we ignore itand build our own key using just the
         # name and version.
-        key = (canonicalize_name(req.name), str(version))
+        key = (canon(req.name), str(version))
         if key in self._build_requirements:
             return
         logger.info(f"adding {key} to build order")
@@ -1344,7 +1349,7 @@ class Bootstrapper:
         info = {
             "req": str(req),
             "constraint": str(constraint) if constraint else "",
-            "dist": canonicalize_name(req.name),
+            "dist": canon(req.name),
             "version": str(version),
             "prebuilt": prebuilt,
             "source_url": source_url,
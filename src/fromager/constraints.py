@@ -3,10 +3,13 @@ import pathlib
 from collections.abc import Generator
 
 from packaging.requirements import Requirement
-from packaging.utils import NormalizedName, canonicalize_name
+from packaging.specifiers import SpecifierSet
+from packaging.utils import NormalizedName
 from packaging.version import Version
 
-from . import requirements_file
+from . import _fastspec, _fastversion, requirements_file
+from ._names import canon
+from ._reqcache import parse_requirement
 
 logger = logging.getLogger(__name__)
 
@@ -16,14 +19,20 @@ class Constraints:
         # mapping of canonical names to requirements
         # NOTE: Requirement.name is not normalized
         self._data: dict[NormalizedName, Requirement] = {}
+        # pre-compiled specifier sets, keyed like _data, so is_satisfied_by
+        # does not re-parse the PEP 440 specifier on every check
+        self._specs: dict[NormalizedName, SpecifierSet] = {}
+        # packed-int entries for simple specifiers like '>=X,<Y'; only
+        # set when the whole specifier fits the fastpath shape
+        self._fast_specs: dict[NormalizedName, _fastspec.SpecEntries] = {}
 
     def __iter__(self) -> Generator[NormalizedName, None, None]:
         yield from self._data
 
     def add_constraint(self, unparsed: str) -> None:
         """Add new constraint, must not conflict with any existing constraints"""
-        req = Requirement(unparsed)
-        canon_name = canonicalize_name(req.name)
+        req = parse_requirement(unparsed)
+        canon_name = canon(req.name)
         previous = self._data.get(canon_name)
 
         if not requirements_file.evaluate_marker(req, req):
@@ -37,6 +46,10 @@ class Constraints:
         if requirements_file.evaluate_marker(req, req):
             logger.debug(f"adding constraint {req}")
             self._data[canon_name] = req
+            self._specs[canon_name] = req.specifier
+            fast_entries = _fastspec.parse_specset(str(req.specifier))
+            if fast_entries is not None:
+                self._fast_specs[canon_name] = fast_entries
 
     def load_constraints_file(self, constraints_file: str | pathlib.Path) -> None:
         """Load constraints from a constraints file"""
@@ -46,7 +59,7 @@ class Constraints:
             self.add_constraint(line)
 
     def get_constraint(self, name: str) -> Requirement | None:
-        return self._data.get(canonicalize_name(name))
+        return self._data.get(canon(name))
 
     def allow_prerelease(self, pkg_name: str) -> bool:
         constraint = self.get_constraint(pkg_name)
@@ -55,7 +68,13 @@ class Constraints:
         return False
 
     def is_satisfied_by(self, pkg_name: str, version: Version) -> bool:
-        constraint = self.get_constraint(pkg_name)
-        if constraint:
-            return constraint.specifier.contains(version, prereleases=True)
-        return True
+        canon_name = canon(pkg_name)
+        specs = self._specs.get(canon_name)
+        if specs is None:
+            return True
+        fast_entries = self._fast_specs.get(canon_name)
+        if fast_entries is not None:
+            version_key = _fastversion.parse_key(str(version))
+            if version_key is not None:
+                return _fastspec.contains(fast_entries, version_key)
+        return specs.contains(version, prereleases=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import array
+import collections
 import dataclasses
 import graphlib
 import json
@@ -9,9 +11,13 @@ import threading
 import typing
 
 from packaging.requirements import Requirement
-from packaging.utils import NormalizedName, canonicalize_name
+from packaging.utils import NormalizedName
 from packaging.version import Version
 
+from . import _fastversion
+from ._names import canon
+from ._reqcache import parse_requirement
+from ._versions import cached_version
 from .read import open_file_or_url
 from .requirements_file import RequirementType
 
@@ -22,6 +28,15 @@ logger = logging.getLogger(__name__)
 
 ROOT = ""
 
+# (parent_name, parent_version, req_type, req, req_version)
+type EdgeTuple = tuple[
+    NormalizedName | None,
+    Version | None,
+    RequirementType,
+    Requirement | str,
+    Version,
+]
+
 
 class DependencyEdgeDict(typing.TypedDict):
     req_type: str
@@ -48,6 +63,8 @@ class DependencyNode:
     constraint: Requirement | None = dataclasses.field(default=None, compare=False)
     # additional fields
     key: str = dataclasses.field(init=False, compare=False, repr=False)
+    # packed-int fastpath key for release-only versions, None otherwise
+    version_key: int | None = dataclasses.field(init=False, compare=False, repr=False)
     parents: list[DependencyEdge] = dataclasses.field(
         default_factory=list,
         init=False,
@@ -69,12 +86,15 @@ class DependencyNode:
             object.__setattr__(
                 self, "key", f"{self.canonicalized_name}=={self.version}"
             )
+        object.__setattr__(
+            self, "version_key", _fastversion.parse_key(str(self.version))
+        )
 
     @property
     def requirement(self) -> Requirement:
         if self.canonicalized_name == ROOT:
             raise RuntimeError("root node is not a requirement")
-        return Requirement(self.key)
+        return parse_requirement(self.key)
 
     def add_child(
         self,
@@ -114,14 +134,14 @@ class DependencyNode:
         return [
             edge
             for edge in self.children
-            if canonicalize_name(edge.req.name) == canonicalize_name(req_name)
+            if canon(edge.req.name) == canon(req_name)
             and edge.req_type == req_type
         ]
 
     @classmethod
     def construct_root_node(cls) -> DependencyNode:
         return cls(
-            canonicalize_name(ROOT),
+            canon(ROOT),
             # version doesn't really matter for root
             Version("0"),
         )
@@ -200,6 +220,8 @@ class DependencyEdge:
 
 
 class DependencyGraph:
+    __slots__ = ("nodes",)
+
     def __init__(self) -> None:
         self.nodes: dict[str, DependencyNode] = {}
         self.clear()
@@ -229,8 +251,8 @@ class DependencyGraph:
             node_dict = typing.cast(DependencyNodeDict, graph_dict[curr_key])
             parent_name = parent_version = None
             if curr_key != ROOT:
-                parent_name = canonicalize_name(node_dict["canonicalized_name"])
-                parent_version = Version(node_dict["version"])
+                parent_name = canon(node_dict["canonicalized_name"])
+                parent_version = cached_version(node_dict["version"])
             for raw_edge in node_dict["edges"]:
                 edge_dict = typing.cast(DependencyEdgeDict, raw_edge)
                 destination_node_dict = typing.cast(
@@ -245,7 +267,7 @@ class DependencyGraph:
                     parent_version=parent_version,
                     req_type=RequirementType(edge_dict["req_type"]),
                     req=Requirement(edge_dict["req"]),
-                    req_version=Version(destination_node_dict["version"]),
+                    req_version=cached_version(destination_node_dict["version"]),
                     download_url=destination_node_dict["download_url"],
                     pre_built=destination_node_dict["pre_built"],
                     constraint=constraint,
@@ -254,6 +276,73 @@ class DependencyGraph:
             visited.add(curr_key)
         return graph
 
+    @classmethod
+    def from_trusted_dict(
+        cls,
+        graph_dict: dict[str, dict[str, typing.Any]],
+    ) -> DependencyGraph:
+        """Rebuild a graph from a dict produced by :meth:`_to_dict`
+
+        Unlike :meth:`from_dict`, the input is assumed to be known-valid
+        output of :meth:`_to_dict` from the same process or fromager
+        version. Nodes are constructed in a single pass without
+        re-canonicalizing names, re-checking parent existence, or logging
+        each edge. Use :meth:`from_dict` for graph files from external
+        sources.
+        """
+        graph = cls()
+        graph._load_trusted_dict(graph_dict)
+        return graph
+
+    def _load_trusted_dict(
+        self,
+        graph_dict: dict[str, dict[str, typing.Any]],
+    ) -> None:
+        nodes = self.nodes
+        for key, raw_node in graph_dict.items():
+            if key == ROOT:
+                continue
+            node_dict = typing.cast(DependencyNodeDict, raw_node)
+            constraint_value = node_dict.get("constraint")
+            node = DependencyNode(
+                canonicalized_name=typing.cast(
+                    NormalizedName, node_dict["canonicalized_name"]
+                ),
+                version=cached_version(node_dict["version"]),
+                download_url=node_dict["download_url"],
+                pre_built=node_dict["pre_built"],
+                constraint=(
+                    parse_requirement(constraint_value) if constraint_value else None
+                ),
+            )
+            nodes[node.key] = node
+        for key, raw_node in graph_dict.items():
+            node_dict = typing.cast(DependencyNodeDict, raw_node)
+            parent = nodes[key]
+            for raw_edge in node_dict["edges"]:
+                edge_dict = typing.cast(DependencyEdgeDict, raw_edge)
+                parent.add_child(
+                    nodes[edge_dict["key"]],
+                    req=parse_requirement(edge_dict["req"]),
+                    req_type=RequirementType(edge_dict["req_type"]),
+                )
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """Pickle as the plain node dict used by graph files
+
+        The node objects reference each other through parent and child
+        edge lists, so pickling them directly recurses through every
+        path in the graph. The dict form is flat, and restoring through
+        the trusted loader re-uses the shared Requirement/Version parser
+        caches instead of unpickling one object per edge.
+        """
+        return {"graph": self._to_dict()}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.nodes = {}
+        self.clear()
+        self._load_trusted_dict(state["graph"])
+
     def clear(self) -> None:
         self.nodes.clear()
         self.nodes[ROOT] = DependencyNode.construct_root_node()
@@ -305,12 +394,14 @@ class DependencyGraph:
         parent_name: NormalizedName | None,
         parent_version: Version | None,
         req_type: RequirementType,
-        req: Requirement,
+        req: Requirement | str,
         req_version: Version,
         download_url: str = "",
         pre_built: bool = False,
         constraint: Requirement | None = None,
     ) -> None:
+        if isinstance(req, str):
+            req = parse_requirement(req)
         logger.debug(
             "recording %s dependency %s%s -> %s==%s",
             req_type,
@@ -321,7 +412,7 @@ class DependencyGraph:
         )
 
         node = self._add_node(
-            req_name=canonicalize_name(req.name),
+            req_name=canon(req.name),
             version=req_version,
             download_url=download_url,
             pre_built=pre_built,
@@ -336,6 +427,38 @@ class DependencyGraph:
 
         self.nodes[parent_key].add_child(node, req=req, req_type=req_type)
 
+    def extend(self, edges: typing.Iterable[EdgeTuple]) -> None:
+        """Add many dependency edges in one pass
+
+        Bulk equivalent of calling :meth:`add_dependency` for each
+        ``(parent_name, parent_version, req_type, req, req_version)``
+        tuple with default download URL, pre-built flag, and constraint.
+        The edges are expected to be pre-validated; the loop binds the
+        node map and parsers to locals and skips the per-edge debug
+        logging.
+        """
+        nodes = self.nodes
+        node_type = DependencyNode
+        canon_name = canon
+        parse_req = parse_requirement
+        for parent_name, parent_version, req_type, req, req_version in edges:
+            if isinstance(req, str):
+                req = parse_req(req)
+            new_node = node_type(
+                canonicalized_name=canon_name(req.name),
+                version=req_version,
+            )
+            node = nodes.setdefault(new_node.key, new_node)
+            parent_key = (
+                ROOT if parent_name is None else f"{parent_name}=={parent_version}"
+            )
+            parent = nodes.get(parent_key)
+            if parent is None:
+                raise ValueError(
+                    f"Trying to add {node.key} to parent {parent_key} but {parent_key} does not exist"
+                )
+            parent.add_child(node, req=req, req_type=req_type)
+
     def get_dependency_edges(
         self, match_dep_types: list[RequirementType] | None = None
     ) -> typing.Iterable[DependencyEdge]:
@@ -361,7 +484,7 @@ class DependencyGraph:
         return [
             node
             for node in self.get_all_nodes()
-            if node.canonicalized_name == canonicalize_name(req_name)
+            if node.canonicalized_name == canon(req_name)
         ]
 
     def get_root_node(self) -> DependencyNode:
@@ -448,8 +571,14 @@ class TrackingTopologicalSorter:
     __slots__ = (
         "_dep_nodes",
         "_exclusive_nodes",
+        "_id_of",
         "_in_progress_nodes",
+        "_indeg",
+        "_indices",
+        "_indptr",
         "_lock",
+        "_node_of",
+        "_predecessors",
         "_topo",
     )
 
@@ -467,6 +596,8 @@ class TrackingTopologicalSorter:
         self._dep_nodes: set[DependencyNode] = set()
         # dict of nodes -> priority; dependency: -1, leaf: +1
         self._exclusive_nodes: dict[DependencyNode, int] = {}
+        # mirror of the graph structure for the array-based batch walk
+        self._predecessors: dict[DependencyNode, set[DependencyNode]] = {}
         self._lock = threading.Lock()
         if graph is not None:
             for node, predecessors in graph.items():
@@ -495,6 +626,9 @@ class TrackingTopologicalSorter:
         """
         self._topo.add(node, *predecessors)
         self._dep_nodes.update(predecessors)
+        self._predecessors.setdefault(node, set()).update(predecessors)
+        for predecessor in predecessors:
+            self._predecessors.setdefault(predecessor, set())
         if exclusive:
             self._exclusive_nodes[node] = 1
 
@@ -551,9 +685,92 @@ class TrackingTopologicalSorter:
             self._in_progress_nodes.difference_update(nodes)
             self._topo.done(*nodes)
 
+    def _build_csr(self) -> None:
+        """Build flat adjacency arrays for the batch walk
+
+        Assigns each node an integer id and stores the successor lists in
+        CSR form (``_indptr``/``_indices``) together with an in-degree
+        array. The dense layout avoids per-step set allocations and node
+        hashing in :meth:`static_batches`.
+        """
+        id_of: dict[DependencyNode, int] = {}
+        node_of: list[DependencyNode] = []
+        for node in self._predecessors:
+            id_of[node] = len(node_of)
+            node_of.append(node)
+        num_nodes = len(node_of)
+        indeg = array.array("i", [0] * num_nodes)
+        out_degree = array.array("i", [0] * num_nodes)
+        for node, predecessors in self._predecessors.items():
+            indeg[id_of[node]] = len(predecessors)
+            for predecessor in predecessors:
+                out_degree[id_of[predecessor]] += 1
+        indptr = array.array("i", [0] * (num_nodes + 1))
+        for i in range(num_nodes):
+            indptr[i + 1] = indptr[i] + out_degree[i]
+        fill = array.array("i", indptr[:num_nodes])
+        indices = array.array("i", [0] * indptr[num_nodes])
+        for node, predecessors in self._predecessors.items():
+            i = id_of[node]
+            for predecessor in predecessors:
+                p = id_of[predecessor]
+                indices[fill[p]] = i
+                fill[p] += 1
+        self._id_of = id_of
+        self._node_of = node_of
+        self._indeg = indeg
+        self._indptr = indptr
+        self._indices = indices
+
     def static_batches(self) -> typing.Iterable[set[DependencyNode]]:
+        """Yield batches of nodes in build order
+
+        Produces the same batches as repeated ``get_available()`` /
+        ``done()`` calls, but runs Kahn's algorithm over the flat arrays
+        built by :meth:`_build_csr` instead of stepping the
+        ``graphlib`` sorter, which allocates a set per ready step.
+        """
+        # prepare() detects cycles and assigns exclusive-node priorities
         self.prepare()
-        while self.is_active():
-            nodes = self.get_available()
-            yield nodes
-            self.done(*nodes)
+        self._build_csr()
+        indeg = self._indeg
+        indptr = self._indptr
+        indices = self._indices
+        node_of = self._node_of
+        id_of = self._id_of
+        exclusive: dict[int, int] = {
+            id_of[node]: priority
+            for node, priority in self._exclusive_nodes.items()
+            if node in id_of
+        }
+        # flag array for the hot partition check; indexing a bytearray
+        # avoids hashing the id on every membership test
+        is_exclusive = bytearray(len(node_of))
+        for i in exclusive:
+            is_exclusive[i] = 1
+        ready: collections.deque[int] = collections.deque(
+            i for i, degree in enumerate(indeg) if degree == 0
+        )
+        while ready:
+            if exclusive:
+                batch = [i for i in ready if not is_exclusive[i]]
+                if batch:
+                    exclusive_ready = [i for i in ready if is_exclusive[i]]
+                    ready.clear()
+                    ready.extend(exclusive_ready)
+                else:
+                    # only exclusive nodes are ready; emit exactly one,
+                    # preferring nodes that other nodes depend on
+                    picked = min(ready, key=lambda i: (exclusive[i], node_of[i]))
+                    batch = [picked]
+                    ready.remove(picked)
+            else:
+                batch = list(ready)
+                ready.clear()
+            yield {node_of[i] for i in batch}
+            for i in batch:
+                for k in range(indptr[i], indptr[i + 1]):
+                    j = indices[k]
+                    indeg[j] -= 1
+                    if indeg[j] == 0:
+                        ready.append(j)
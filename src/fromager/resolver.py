@@ -23,7 +23,6 @@ from packaging.specifiers import InvalidSpecifier, SpecifierSet
 from packaging.tags import Tag, sys_tags
 from packaging.utils import (
     BuildTag,
-    canonicalize_name,
     parse_wheel_filename,
 )
 from packaging.version import Version
@@ -31,6 +30,8 @@ from requests.models import Response
 from resolvelib.resolvers import RequirementInformation
 
 from . import overrides
+from ._names import canon
+from ._versions import cached_version
 from .candidate import Candidate
 from .constraints import Constraints
 from .extras_provider import ExtrasProvider
@@ -58,6 +59,34 @@ SUPPORTED_TAGS_IGNORE_PLATFORM: frozenset[Tag] = frozenset(
 )
 
 
+def match_py_req_uncached(
+    py_req: str, *, python_version: Version = PYTHON_VERSION
+) -> bool:
+    """Uncached Python version requirement check
+
+    Parses the specifier set and runs the containment check directly,
+    bypassing both cache levels of :func:`match_py_req`. This is the raw
+    cost the caches protect against; use it when measuring parser time
+    or when a result must not populate the shared caches.
+
+    Raises InvalidSpecifier on error
+    """
+    return python_version in SpecifierSet(py_req)
+
+
+@functools.lru_cache(maxsize=200)
+def _match_py_req_canon(
+    specs: SpecifierSet, python_version: Version = PYTHON_VERSION
+) -> bool:
+    """Cached containment check keyed on the parsed specifier set
+
+    ``SpecifierSet`` hashes and compares by its canonical specifiers, so
+    different spellings of the same requirement (``>=3.10`` vs.
+    ``>= 3.10``, reordered or duplicated clauses) share one cache entry.
+    """
+    return python_version in specs
+
+
 @functools.lru_cache(maxsize=200)
 def match_py_req(py_req: str, *, python_version: Version = PYTHON_VERSION) -> bool:
     """Python version requirement lookup with LRU cache
@@ -71,8 +100,13 @@ def match_py_req(py_req: str, *, python_version: Version = PYTHON_VERSION) -> bo
     This function caches the result of SpecifierSet parsing and contains
     operation for Python version requirement. Most packages share similar
     constraints, e.g. ``>= 3.10``.
+
+    The cache is two-level: the outer cache is keyed on the raw string,
+    and on a miss the parsed ``SpecifierSet`` is looked up in
+    :func:`_match_py_req_canon`, so equivalent spellings only pay the
+    containment check once.
     """
-    return python_version in SpecifierSet(py_req)
+    return _match_py_req_canon(SpecifierSet(py_req), python_version)
 
 
 def resolve(
@@ -313,7 +347,7 @@ def get_project_from_pypi(
             if dp.package_type == "sdist":
                 is_sdist = True
                 name: str = dp.project
-                version: Version = Version(dp.version)
+                version: Version = cached_version(dp.version)
                 tags: frozenset[Tag] = frozenset()
                 build_tag: BuildTag = ()
             else:
@@ -420,7 +454,7 @@ class BaseProvider(ExtrasProvider):
         raise NotImplementedError()
 
     def identify(self, requirement_or_candidate: Requirement | Candidate) -> str:
-        return canonicalize_name(requirement_or_candidate.name)
+        return canon(requirement_or_candidate.name)
 
     @classmethod
     def clear_cache(cls, identifier: str | None = None) -> None:
@@ -433,7 +467,7 @@ class BaseProvider(ExtrasProvider):
         if identifier is None:
             cls.resolver_cache.clear()
         else:
-            cls.resolver_cache.pop(canonicalize_name(identifier))
+            cls.resolver_cache.pop(canon(identifier))
 
     def get_extras_for(
         self,
@@ -483,7 +517,7 @@ class BaseProvider(ExtrasProvider):
         return sum(1 for _ in candidates[identifier])
 
     def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
-        if canonicalize_name(requirement.name) != candidate.name:
+        if canon(requirement.name) != candidate.name:
             return False
         allow_prerelease = self.constraints.allow_prerelease(requirement.name) or bool(
             requirement.specifier.prereleases
@@ -725,7 +759,7 @@ class GenericProvider(BaseProvider):
 
     def _default_match_function(self, identifier: str, item: str) -> Version | None:
         try:
-            return Version(item)
+            return cached_version(item)
         except Exception as err:
             logger.debug(f"{identifier}: could not parse version from {item}: {err}")
             return None
@@ -741,7 +775,7 @@ class GenericProvider(BaseProvider):
             return None
         value = mo.group(1)
         try:
-            return Version(value)
+            return cached_version(value)
         except Exception as err:
             logger.debug(f"{identifier}: could not parse version from {value}: {err}")
             return None
@@ -458,10 +458,6 @@ def test_to_constraints_command_no_file_on_failure(tmp_path: pathlib.Path) -> No
     This is a regression test for the bug where constraint resolution would write partial
     output even when it ultimately failed.
     """
-    import io
-
-    from fromager import dependency_graph
-
     # Create a graph with conflicts (same as test_write_constraints_file_unresolvable_duplicate)
     raw_graph = {
         "": {
@@ -9,7 +9,7 @@ import pytest
 from packaging.requirements import Requirement
 from packaging.version import Version
 
-from fromager import external_commands, log
+from fromager import __main__, external_commands, log
 
 
 def test_external_commands_environ() -> None:
@@ -156,8 +156,6 @@ def test_external_commands_error_includes_package_name(caplog: typing.Any) -> No
 
 def test_format_exception_formats_chained_exceptions() -> None:
     """Test that _format_exception formats chained exceptions correctly"""
-    from fromager import __main__
-
     # Test basic exception formatting
     exception_without_cause = subprocess.CalledProcessError(
         1, ["command"], output="some output"
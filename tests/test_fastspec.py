@@ -0,0 +1,38 @@
+import pytest
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+from fromager import _fastspec, _fastversion
+
+
+@pytest.mark.parametrize(
+    "spec",
+    ["", ">=1.0", ">=1.0,<2.0", "==1.0", "!=1.5", "<=3.0, >2.1", ">= 1.0 , < 2.0"],
+)
+def test_parse_specset_fastpath(spec: str) -> None:
+    assert _fastspec.parse_specset(spec) is not None
+
+
+@pytest.mark.parametrize(
+    "spec",
+    ["~=1.0", "===1.0", "==1.0.*", ">=1.0rc1", ">=1.0,<2.0.*", "invalid", ">="],
+)
+def test_parse_specset_fallback(spec: str) -> None:
+    assert _fastspec.parse_specset(spec) is None
+
+
+@pytest.mark.parametrize(
+    "spec",
+    ["", ">=1.0", ">=1.0,<2.0", "==1.0", "!=1.5", "<=3.0,>2.1", "<1.5,>0.9,!=1.1"],
+)
+@pytest.mark.parametrize(
+    "version",
+    ["0.9", "1.0", "1.0.0", "1.1", "1.5", "2.0", "2.0.1", "2.1", "3.0", "10.0"],
+)
+def test_contains_matches_specifierset(spec: str, version: str) -> None:
+    entries = _fastspec.parse_specset(spec)
+    assert entries is not None
+    key = _fastversion.parse_key(version)
+    assert key is not None
+    expected = SpecifierSet(spec).contains(Version(version), prereleases=True)
+    assert _fastspec.contains(entries, key) == expected
@@ -0,0 +1,63 @@
+import pytest
+from packaging.version import Version
+
+from fromager import _fastversion
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["0", "1.0", "1.0.0", "1.25.0", "2024.1", "10.20.30.40", "65535.65535"],
+)
+def test_parse_key_release_only(version: str) -> None:
+    key = _fastversion.parse_key(version)
+    assert key is not None
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "",
+        ".",
+        "1.",
+        ".1",
+        "1..0",
+        "1.0rc1",
+        "1.0.post1",
+        "1.0.dev1",
+        "1!1.0",
+        "1.0+local",
+        "1.0.*",
+        " 1.0",
+        "1.0.0.0.0",  # too many segments
+        "65536",  # segment overflow
+        "v1.0",
+    ],
+)
+def test_parse_key_fallback(version: str) -> None:
+    assert _fastversion.parse_key(version) is None
+
+
+def test_parse_key_ordering_matches_packaging() -> None:
+    versions = ["1.0", "1.0.0", "1.0.1", "1.1", "2.0", "0.9.9", "10.0", "1.25.0"]
+    keys = {v: _fastversion.parse_key(v) for v in versions}
+    for a in versions:
+        for b in versions:
+            assert (keys[a] < keys[b]) == (Version(a) < Version(b))
+            assert (keys[a] == keys[b]) == (Version(a) == Version(b))
+
+
+def test_parse_fastpath() -> None:
+    key, version = _fastversion.parse("1.0.0")
+    assert key == _fastversion.parse_key("1.0.0")
+    assert version is None
+
+
+def test_parse_fallback() -> None:
+    key, version = _fastversion.parse("1.0.0rc1")
+    assert key is None
+    assert version == Version("1.0.0rc1")
+
+
+def test_parse_invalid() -> None:
+    with pytest.raises(Exception):
+        _fastversion.parse("not a version")
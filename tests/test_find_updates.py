@@ -1,3 +1,5 @@
+import unittest.mock
+
 from packaging.requirements import Requirement
 from packaging.version import Version
 
@@ -77,8 +79,6 @@ class TestGetConstraintVersion:
         """Test that invalid version formats return None."""
         # We need to test the case where Version() construction fails
         # Let's create a requirement and then mock the Version parsing
-        import unittest.mock
-
         req = Requirement("package==1.0.0")
 
         with unittest.mock.patch(
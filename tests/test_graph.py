@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from packaging.requirements import Requirement
 from packaging.utils import canonicalize_name
@@ -100,11 +102,62 @@ def test_graph_add_dependency() -> None:
     assert graph._to_dict() == raw_graph
 
 
+def test_graph_extend() -> None:
+    graph = dependency_graph.DependencyGraph()
+    graph.extend(
+        [
+            (
+                None,
+                None,
+                requirements_file.RequirementType.TOP_LEVEL,
+                Requirement("a==2.0"),
+                Version("2.0"),
+            ),
+            (
+                canonicalize_name("a"),
+                Version("2.0"),
+                requirements_file.RequirementType.INSTALL,
+                "b>=3.0",
+                Version("3.0"),
+            ),
+        ]
+    )
+    assert set(graph.nodes) == {"", "a==2.0", "b==3.0"}
+    assert graph.nodes["a==2.0"].children[0].destination_node.key == "b==3.0"
+
+    with pytest.raises(ValueError):
+        # extend with a parent that doesn't exist
+        graph.extend(
+            [
+                (
+                    canonicalize_name("z"),
+                    Version("1.0"),
+                    requirements_file.RequirementType.INSTALL,
+                    Requirement("c==1.0"),
+                    Version("1.0"),
+                ),
+            ]
+        )
+
+
 def test_graph_from_dict() -> None:
     graph = dependency_graph.DependencyGraph.from_dict(raw_graph)
     assert graph._to_dict() == raw_graph
 
 
+def test_graph_pickle_roundtrip() -> None:
+    graph = dependency_graph.DependencyGraph.from_dict(raw_graph)
+    restored = pickle.loads(pickle.dumps(graph))
+    assert restored._to_dict() == raw_graph
+    assert restored.nodes == graph.nodes
+
+
+def test_graph_from_trusted_dict() -> None:
+    graph = dependency_graph.DependencyGraph.from_trusted_dict(raw_graph)
+    assert graph._to_dict() == raw_graph
+    assert graph.nodes == dependency_graph.DependencyGraph.from_dict(raw_graph).nodes
+
+
 def test_get_install_dependencies() -> None:
     graph = dependency_graph.DependencyGraph.from_dict(raw_graph)
     graph.add_dependency(
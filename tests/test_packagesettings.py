@@ -17,6 +17,7 @@ from fromager.packagesettings import (
     Package,
     PackageSettings,
     ResolverDist,
+    Settings,
     SettingsFile,
     Variant,
     substitute_template,
@@ -725,10 +726,6 @@ build_options:
     assert custom_settings.build_options.exclusive_build is True
 
     # Test PackageBuildInfo properly accesses it through build_options
-    import pathlib
-
-    from fromager.packagesettings import Settings, SettingsFile
-
     # Create a temporary Settings object to test with
     settings = Settings(
         settings=SettingsFile(),
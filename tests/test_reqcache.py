@@ -0,0 +1,14 @@
+from packaging.requirements import Requirement
+
+from fromager._reqcache import parse_requirement
+
+
+def test_parse_requirement_returns_requirement() -> None:
+    req = parse_requirement("pkg>=1.0")
+    assert isinstance(req, Requirement)
+    assert req.name == "pkg"
+    assert str(req.specifier) == ">=1.0"
+
+
+def test_parse_requirement_is_cached() -> None:
+    assert parse_requirement("other-pkg==2.0") is parse_requirement("other-pkg==2.0")
@@ -1109,3 +1109,26 @@ def test_custom_resolver_error_message_via_resolve() -> None:
         assert "pypi.org" not in error_message.lower(), (
             f"Error message incorrectly mentions PyPI when using GitHub resolver: {error_message}"
         )
+
+
+def test_match_py_req() -> None:
+    assert resolver.match_py_req(">=3.0", python_version=Version("3.12"))
+    assert not resolver.match_py_req(">=4.0", python_version=Version("3.12"))
+    assert resolver.match_py_req("==3.*", python_version=Version("3.12"))
+
+
+def test_match_py_req_canonical_spellings_share_cache() -> None:
+    resolver._match_py_req_canon.cache_clear()
+    assert resolver.match_py_req(">=3.0,<4.0", python_version=Version("3.12"))
+    assert resolver.match_py_req("<4.0, >= 3.0", python_version=Version("3.12"))
+    info = resolver._match_py_req_canon.cache_info()
+    assert info.hits >= 1
+    assert info.misses == 1
+
+
+def test_match_py_req_uncached() -> None:
+    resolver.match_py_req.cache_clear()
+    resolver._match_py_req_canon.cache_clear()
+    assert resolver.match_py_req_uncached(">=3.0", python_version=Version("3.12"))
+    assert resolver.match_py_req.cache_info().currsize == 0
+    assert resolver._match_py_req_canon.cache_info().currsize == 0
@@ -0,0 +1,17 @@
+import pytest
+from packaging.version import InvalidVersion, Version
+
+from fromager._versions import cached_version
+
+
+def test_cached_version_returns_version() -> None:
+    assert cached_version("1.25.0") == Version("1.25.0")
+
+
+def test_cached_version_is_cached() -> None:
+    assert cached_version("2.0.1") is cached_version("2.0.1")
+
+
+def test_cached_version_invalid() -> None:
+    with pytest.raises(InvalidVersion):
+        cached_version("not a version")